@@ -4,22 +4,20 @@ _EXAMPLES = Path(__file__).resolve().parent.parent
 if str(_EXAMPLES) not in sys.path:
     sys.path.insert(0, str(_EXAMPLES))
 from run_main import run_with_keyboard_interrupt
+from live_config import load_controller_config
 
-import asyncio
-import yaml
-from pathlib import Path
 from zencontrol import ZenCommandClient
 from zencontrol.interface import EntityContext
 
 async def main():
     """Test the async ZenCommandClient with ctrl queries"""
     # Load configuration
-    config = yaml.safe_load(open(Path(__file__).resolve().parents[2] / "tests" / "config.yaml"))
+    ctrl_config = load_controller_config()
     
     # Create protocol and controller
     async with ZenCommandClient(print_traffic=True) as tpi:
         ctx = EntityContext(commands=tpi)
-        ctrl = ctx.ctrl(**config.get('zencontrol')[0])
+        ctrl = ctx.ctrl(**ctrl_config)
         
         print("Testing ZenController queries...")
         print("=" * 50)
@@ -4,22 +4,23 @@ _EXAMPLES = Path(__file__).resolve().parent.parent
 if str(_EXAMPLES) not in sys.path:
     sys.path.insert(0, str(_EXAMPLES))
 from run_main import run_with_keyboard_interrupt
+from live_config import load_controller_config
+from live_gather import gather_bounded
 
-import asyncio
-import yaml
-from pathlib import Path
 from zencontrol import ZenCommandClient
 from zencontrol.interface import EntityContext
 
+QUERY_CONCURRENCY = 4
+
 async def main():
     """Test DALI device queries"""
     # Load configuration
-    config = yaml.safe_load(open(Path(__file__).resolve().parents[2] / "tests" / "config.yaml"))
+    ctrl_config = load_controller_config()
     
     # Create protocol and controller
     async with ZenCommandClient(print_traffic=False) as tpi:
         ctx = EntityContext(commands=tpi)
-        ctrl = ctx.ctrl(**config.get('zencontrol')[0])
+        ctrl = ctx.ctrl(**ctrl_config)
         
         print("Testing DALI device queries...")
         print("=" * 50)
@@ -31,21 +32,20 @@ async def main():
             for address in addresses:
                 print(f"  {address.number}")
 
-                label = await tpi.query_dali_device_label(address)
+                # Overlap the round trips, a few at a time so the controller is not flooded.
+                label, operating_mode, serial, ean, fitting = await gather_bounded(QUERY_CONCURRENCY, (
+                    tpi.query_dali_device_label(address),
+                    tpi.query_operating_mode_by_address(address),
+                    tpi.query_dali_serial(address),
+                    tpi.query_dali_ean(address),
+                    tpi.query_dali_fitting_number(address),
+                ))
                 if label is None:
                     label = f"{address.ctrl.label} ECD {address.number}"
                 print(f"    label: {label}")
-
-                operating_mode = await tpi.query_operating_mode_by_address(address)
                 print(f"    operating mode: {operating_mode}")
-
-                serial = await tpi.query_dali_serial(address)
                 print(f"    serial: {serial}")
-
-                ean = await tpi.query_dali_ean(address)
                 print(f"    ean: {ean}")
-
-                fitting = await tpi.query_dali_fitting_number(address)
                 print(f"    fitting: {fitting}")
                 
         except Exception as e:
@@ -1,7 +1,7 @@
 import asyncio
 import logging
-import yaml
-import time
+import logging.handlers
+import queue
 from pathlib import Path
 import sys
 
@@ -14,40 +14,36 @@ sys.stdout.reconfigure(line_buffering=True)
 from zencontrol import ZenControl
 from zencontrol.interface.interface import ZenButton, ZenGroup, ZenLight
 from run_main import run_with_keyboard_interrupt
-
-CONFIG_PATH = Path(__file__).resolve().parents[2] / "tests" / "config.yaml"
-
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+from live_config import load_controller_config
+from live_timing import elapsed_ms
+
+# Callbacks only enqueue records; a listener thread does the terminal writes,
+# so a slow or piped stdout never stalls event handling on the loop. The
+# inter-event delta rides in the same record so it stays with its event.
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
 logger = logging.getLogger("test_events")
 
-timevar = None
-
-
-def ms():
-    """Print time since last call in milliseconds."""
-    global timevar
-    timevar = timevar or time.time()
-    msecs = (time.time() - timevar) * 1000
-    timevar = time.time()
-    print(f"{msecs:.1f} ms")
-
-
 async def on_button_press(button: ZenButton) -> None:
-    ms()
+    delta = elapsed_ms()
     inst = button.instance
-    print(f"Button Press Event       - ECD {inst.address.number} instance {inst.number}")
+    logger.info("%.1f ms Button Press Event       - ECD %s instance %s", delta, inst.address.number, inst.number)
 
 
 async def on_light_change(*, light: ZenLight) -> None:
-    ms()
+    delta = elapsed_ms()
     addr = light.address
-    print(f"Level Change Event       - {addr.type} {addr.number} level {light.level}")
+    logger.info("%.1f ms Level Change Event       - %s %s level %s", delta, addr.type, addr.number, light.level)
 
 
 async def on_group_change(*, group: ZenGroup, discoordinated: bool = False) -> None:
-    ms()
+    delta = elapsed_ms()
     addr = group.address
-    print(f"Level Change Event Group - {addr.type} {addr.number} level {group.level}")
+    logger.info("%.1f ms Level Change Event Group - %s %s level %s", delta, addr.type, addr.number, group.level)
 
 
 def check_event_listener(zen: ZenControl) -> None:
@@ -71,10 +67,17 @@ def check_event_listener(zen: ZenControl) -> None:
 
 async def main():
     """Test ZenControl event monitoring."""
-    config = yaml.safe_load(CONFIG_PATH.read_text())
+    ctrl_config = load_controller_config()
+    _log_listener.start()
+    try:
+        await _monitor(ctrl_config)
+    finally:
+        _log_listener.stop()
+
 
+async def _monitor(ctrl_config: dict) -> None:
     async with ZenControl(print_traffic=True, logger=logger) as zen:
-        zen.add_controller(**config.get("zencontrol")[0])
+        zen.add_controller(**ctrl_config)
         ctrl = zen.controllers[0]
 
         zen.callbacks.button_press = on_button_press
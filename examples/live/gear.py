@@ -5,22 +5,24 @@ _EXAMPLES = Path(__file__).resolve().parent.parent
 if str(_EXAMPLES) not in sys.path:
     sys.path.insert(0, str(_EXAMPLES))
 from run_main import run_with_keyboard_interrupt
+from live_config import load_controller_config
+from live_gather import gather_bounded
 
-import asyncio
-import yaml
-from pathlib import Path
-from zencontrol import ZenCommandClient
+from typing import Any
+from zencontrol import ZenAddress, ZenCommandClient
 from zencontrol.interface import EntityContext
 
+QUERY_CONCURRENCY = 4
+
 async def main():
     """Test control gear queries"""
     # Load configuration
-    config = yaml.safe_load(open(Path(__file__).resolve().parents[2] / "tests" / "config.yaml"))
+    ctrl_config = load_controller_config()
     
     # Create protocol and controller
     async with ZenCommandClient(print_traffic=False) as tpi:
         ctx = EntityContext(commands=tpi)
-        ctrl = ctx.ctrl(**config.get('zencontrol')[0])
+        ctrl = ctx.ctrl(**ctrl_config)
         
         print("Testing control gear queries...")
         print("=" * 50)
@@ -30,60 +32,40 @@ async def main():
             print(f"Control gears")    
 
             
-            for address in addresses[:5]: # Only first 5 gears
-                print(f"  {address.number}")
-
-                level = await tpi.dali_query_level(address)
-                print(f"    current level: {level}")
-
-                label = await tpi.query_dali_device_label(address)
-                print(f"    label: {label}")
-
-                groups = await tpi.query_group_membership_by_address(address)
-                print(f"    groups: {[group.number for group in groups]}")
-                
-                type = await tpi.dali_query_cg_type(address)
-                print(f"    type: {type}")
-
-                colour = await tpi.query_dali_colour(address)
-                print(f"    colour: {colour}")
-                
-                cgtype = await tpi.query_dali_colour_features(address)
-                print(f"    colour features: {cgtype}")
-
-                colour_temp_limits = await tpi.query_dali_colour_temp_limits(address)
-                print(f"    colour temp limits: {colour_temp_limits}")
-
-                fitting = await tpi.query_dali_fitting_number(address)
-                print(f"    fitting: {fitting}")
-
-                ean = await tpi.query_dali_ean(address)
-                print(f"    ean: {ean}")
-
-                serial = await tpi.query_dali_serial(address)
-                print(f"    serial: {serial}")
-
-                last_scene = await tpi.dali_query_last_scene(address)
-                print(f"    last scene: {last_scene}")
-
-                last_scene_is_current = await tpi.dali_query_last_scene_is_current(address)
-                print(f"    last scene is current: {last_scene_is_current}")
-
-                status = await tpi.dali_query_control_gear_status(address)
-                print(f"    status: {status}")
-
-                scenes = await tpi.query_scene_numbers_by_address(address)
-                print(f"    scenes with levels: {scenes}")
-
-                scenes = await tpi.query_colour_scene_membership_by_address(address)
-                print(f"    scenes with colours: {scenes}")
-
-                levels = await tpi.query_scene_levels_by_address(address)
-                print(f"    scene levels: {levels}")
+            async def query_gear(address: ZenAddress) -> dict[str, Any]:
+                # Independent queries: overlap the round trips, a few at a time so
+                # the controller is not flooded.
+                queries = {
+                    "current level": tpi.dali_query_level(address),
+                    "label": tpi.query_dali_device_label(address),
+                    "groups": tpi.query_group_membership_by_address(address),
+                    "type": tpi.dali_query_cg_type(address),
+                    "colour": tpi.query_dali_colour(address),
+                    "colour features": tpi.query_dali_colour_features(address),
+                    "colour temp limits": tpi.query_dali_colour_temp_limits(address),
+                    "fitting": tpi.query_dali_fitting_number(address),
+                    "ean": tpi.query_dali_ean(address),
+                    "serial": tpi.query_dali_serial(address),
+                    "last scene": tpi.dali_query_last_scene(address),
+                    "last scene is current": tpi.dali_query_last_scene_is_current(address),
+                    "status": tpi.dali_query_control_gear_status(address),
+                    "scenes with levels": tpi.query_scene_numbers_by_address(address),
+                    "scenes with colours": tpi.query_colour_scene_membership_by_address(address),
+                    "scene levels": tpi.query_scene_levels_by_address(address),
+                    "scene colour data": tpi.query_scene_colours_by_address(address),
+                }
+                results = dict(zip(queries, await gather_bounded(QUERY_CONCURRENCY, queries.values())))
+                results["groups"] = ", ".join(str(group.number) for group in results["groups"] or [])
+                return results
+
+            gear = addresses[:5] # Only first 5 gears
+            for address in gear:
+                results = await query_gear(address)
+                # One write per gear block rather than one per line.
+                lines = [f"  {address.number}"]
+                lines.extend(f"    {name}: {value}" for name, value in results.items())
+                print("\n".join(lines))
 
-                scene_data = await tpi.query_scene_colours_by_address(address)
-                print(f"    scene colour data: {scene_data}")
-                
         except Exception as e:
             print(f"Error during testing: {e}")
         
@@ -5,22 +5,24 @@ _EXAMPLES = Path(__file__).resolve().parent.parent
 if str(_EXAMPLES) not in sys.path:
     sys.path.insert(0, str(_EXAMPLES))
 from run_main import run_with_keyboard_interrupt
+from live_config import load_controller_config
+from live_gather import gather_bounded
 
 import asyncio
-import yaml
-from pathlib import Path
 from zencontrol import ZenCommandClient
 from zencontrol.interface import EntityContext
 
+QUERY_CONCURRENCY = 4
+
 async def main():
     """Test group queries"""
     # Load configuration
-    config = yaml.safe_load(open(Path(__file__).resolve().parents[2] / "tests" / "config.yaml"))
+    ctrl_config = load_controller_config()
     
     # Create protocol and controller
     async with ZenCommandClient(print_traffic=True) as tpi:
         ctx = EntityContext(commands=tpi)
-        ctrl = ctx.ctrl(**config.get('zencontrol')[0])
+        ctrl = ctx.ctrl(**ctrl_config)
         
         print("Testing group queries...")
         print("=" * 50)
@@ -31,24 +33,36 @@ async def main():
 
             for address in addresses:
                 print(f"  {address.number}")
-                name = await tpi.query_group_label(address)
-                print(f"    name: {name}")
-
-                information = await tpi.query_group_by_number(address)
-                print(f"    information: {information}")
-
-                scenes = await tpi.query_scene_numbers_for_group(address)
-                print(f"    scenes: {scenes}")
+                # Independent queries go out together; the client matches replies by sequence.
+                name, information, scenes = await asyncio.gather(
+                    tpi.query_group_label(address),
+                    tpi.query_group_by_number(address),
+                    tpi.query_scene_numbers_for_group(address),
+                )
+                labels = await gather_bounded(
+                    QUERY_CONCURRENCY,
+                    (tpi.query_scene_label_for_group(address, scene) for scene in scenes),
+                )
 
-                for scene in scenes:
-                    label = await tpi.query_scene_label_for_group(address, scene)
-                    print(f"    Group {address.number} scene {scene} label: {label}")
+                # One write per group block rather than one per line.
+                lines = [
+                    f"    name: {name}",
+                    f"    information: {information}",
+                    f"    scenes: {scenes}",
+                ]
+                lines.extend(f"    Group {address.number} scene {scene} label: {label}" for scene, label in zip(scenes, labels))
+                print("\n".join(lines))
 
-            gear = await tpi.query_control_gear_dali_addresses(ctrl)
+            gears = await tpi.query_control_gear_dali_addresses(ctrl)
             print(f"Gear")
-            for gear in gear:
+            # TPI has no all-addresses membership query; overlap the per-gear ones instead,
+            # a few at a time so the controller is not flooded.
+            memberships = await gather_bounded(
+                QUERY_CONCURRENCY,
+                (tpi.query_group_membership_by_address(gear) for gear in gears),
+            )
+            for gear, groups in zip(gears, memberships):
                 print(f"  {gear.number}")
-                groups = await tpi.query_group_membership_by_address(gear)
                 for group in groups:
                     print(f"    group: {group}")
                     
@@ -5,22 +5,23 @@ _EXAMPLES = Path(__file__).resolve().parent.parent
 if str(_EXAMPLES) not in sys.path:
     sys.path.insert(0, str(_EXAMPLES))
 from run_main import run_with_keyboard_interrupt
+from live_config import load_controller_config
+from live_gather import gather_bounded
 
-import asyncio
-import yaml
-from pathlib import Path
 from zencontrol import ZenCommandClient
 from zencontrol.interface import EntityContext
 
+QUERY_CONCURRENCY = 4
+
 async def main():
     """Test instance queries"""
     # Load configuration
-    config = yaml.safe_load(open(Path(__file__).resolve().parents[2] / "tests" / "config.yaml"))
+    ctrl_config = load_controller_config()
     
     # Create protocol and controller
     async with ZenCommandClient(print_traffic=False) as tpi:
         ctx = EntityContext(commands=tpi)
-        ctrl = ctx.ctrl(**config.get('zencontrol')[0])
+        ctrl = ctx.ctrl(**ctrl_config)
         
         print("Testing instance queries...")
         print("=" * 50)
@@ -32,31 +33,32 @@ async def main():
             for address in addresses:
                 print(f"  {address.number}")
 
-                label = await tpi.query_dali_device_label(address)
+                # Overlap the round trips, a few at a time so the controller is not flooded.
+                label, operating_mode, instances = await gather_bounded(QUERY_CONCURRENCY, (
+                    tpi.query_dali_device_label(address),
+                    tpi.query_operating_mode_by_address(address),
+                    tpi.query_instances_by_address(address),
+                ))
                 print(f"    label: {label}")
-
-                operating_mode = await tpi.query_operating_mode_by_address(address)
                 print(f"    operating mode: {operating_mode}")
-
-                instances = await tpi.query_instances_by_address(address)
                 # print(f"    instances: {instances}")
 
                 for instance in instances:
                     
-                    instance_label = await tpi.query_dali_instance_label(instance)
-                    print(f"      {instance.number} - {instance_label}")
-
-                    groups = await tpi.query_instance_groups(instance)
-                    print(f"      groups: {groups}")
-
-                    fitting = await tpi.query_dali_instance_fitting_number(instance)
-                    print(f"      fitting: {fitting}")
-
-                    occupancy_timers = await tpi.query_occupancy_instance_timers(instance)
-                    print(f"      occupancy timers: {occupancy_timers}")
-
-                    last_known_led_state = await tpi.query_last_known_dali_button_led_state(instance)
-                    print(f"      last known led state: {last_known_led_state}")
+                    instance_label, groups, fitting, occupancy_timers, last_known_led_state = await gather_bounded(QUERY_CONCURRENCY, (
+                        tpi.query_dali_instance_label(instance),
+                        tpi.query_instance_groups(instance),
+                        tpi.query_dali_instance_fitting_number(instance),
+                        tpi.query_occupancy_instance_timers(instance),
+                        tpi.query_last_known_dali_button_led_state(instance),
+                    ))
+                    print("\n".join((
+                        f"      {instance.number} - {instance_label}",
+                        f"      groups: {groups}",
+                        f"      fitting: {fitting}",
+                        f"      occupancy timers: {occupancy_timers}",
+                        f"      last known led state: {last_known_led_state}",
+                    )))
                     
         except Exception as e:
             print(f"Error during testing: {e}")
@@ -5,59 +5,66 @@ _EXAMPLES = Path(__file__).resolve().parent.parent
 if str(_EXAMPLES) not in sys.path:
     sys.path.insert(0, str(_EXAMPLES))
 from run_main import run_with_keyboard_interrupt
+from live_config import load_controller_config
+from live_gather import gather_bounded
 
-import asyncio
-from zencontrol import ZenControl
-import yaml
-from pathlib import Path
 import time
+from zencontrol import ZenButton, ZenControl, ZenLight, ZenMotionSensor
+
+SYSVAR_CONCURRENCY = 4
 
 async def main():
-    config = yaml.safe_load(open(Path(__file__).resolve().parents[2] / "tests" / "config.yaml"))
+    ctrl_config = load_controller_config()
     zen = ZenControl(print_traffic=False)
-    zen.add_controller(**config.get('zencontrol')[0])
+    zen.add_controller(**ctrl_config)
     await zen.start()
 
-    timer_start = time.time()
+    timer_start = time.perf_counter()
 
-    print("Profiles")
+    # One scan per section, in sequence: each is already a long run of queries,
+    # and get_system_variables stops early on consecutive lost answers.
     profiles = await zen.get_profiles()
+    control_gear = await zen.get_control_gear()
+    groups = await zen.get_groups()
+    instances = await zen.get_instances()
+    system_variables = await zen.get_system_variables()
+    lights = {g for g in control_gear if isinstance(g, ZenLight)}
+    buttons = {e for e in instances if isinstance(e, ZenButton)}
+    motion_sensors = {e for e in instances if isinstance(e, ZenMotionSensor)}
+    # Up to MAX_SYSVAR of these; a few at a time so the controller is not flooded.
+    values = await gather_bounded(SYSVAR_CONCURRENCY, (zsv.get_value() for zsv in system_variables))
+
+    print("Profiles")
     for profile in profiles:
         print(f"  • {profile}")
 
     print("Lights")
-    lights = await zen.get_lights()
     for light in lights:
         print(f"  • {light}")
         for group in light.groups:
             print(f"      • {group}")
 
     print("Groups")
-    groups = await zen.get_groups()
     for group in groups:
         print(f"  • {group}")
         for light in group.lights:
             print(f"      • {light}")
 
     print("Buttons")
-    buttons = await zen.get_buttons()
     for button in buttons:
         print(f"  • {button}")
 
     print("Motion sensors")
-    motion_sensors = await zen.get_motion_sensors()
     for motion_sensor in motion_sensors:
         print(f"  • {motion_sensor}")
         print(f"      = {'occupied' if motion_sensor.occupied else 'not occupied'}")
 
     print("System variables")
-    system_variables = await zen.get_system_variables()
-    for zsv in system_variables:
+    for zsv, value in zip(system_variables, values):
         print(f"  • {zsv}")
-        value = await zsv.get_value()
         print(f"      = {value}")
 
-    timer_end = time.time()
+    timer_end = time.perf_counter()
     print(f"Time taken: {timer_end - timer_start} seconds")
 
 if __name__ == "__main__":
@@ -5,17 +5,16 @@ _EXAMPLES = Path(__file__).resolve().parent.parent
 if str(_EXAMPLES) not in sys.path:
     sys.path.insert(0, str(_EXAMPLES))
 from run_main import run_with_keyboard_interrupt
+from live_config import load_controller_config
+from live_timing import ms
 
 import asyncio
 from zencontrol import ZenControl, ZenProfile, ZenGroup, ZenLight, ZenButton, ZenMotionSensor, ZenSystemVariable
-import yaml
-from pathlib import Path
-import time
 
 async def main():
-    config = yaml.safe_load(open(Path(__file__).resolve().parents[2] / "tests" / "config.yaml"))
+    ctrl_config = load_controller_config()
     zen = ZenControl(print_traffic=False)
-    zen.add_controller(**config.get('zencontrol')[0])
+    zen.add_controller(**ctrl_config)
 
     # Handlers
     async def _zen_on_connect() -> None:
@@ -52,14 +51,6 @@ async def main():
         ms()
         print(f"System Variable Change   - {system_variable} value {system_variable.value} {'by me' if by_me else 'by someone else'}")
 
-    timevar = None
-    def ms():
-        nonlocal timevar
-        timevar = timevar or time.time()
-        msecs = (time.time() - timevar) * 1000
-        timevar = time.time()
-        print(f"{msecs:.1f} ms")
-
     # Set up event callbacks
     # zen.callbacks.on_connect = _zen_on_connect
     # zen.callbacks.on_disconnect = _zen_on_disconnect
@@ -76,11 +67,10 @@ async def main():
 
     print("Event monitoring started. Press Ctrl+C to stop.")
     
-    # Loop forever
+    # Run until cancelled (Ctrl+C / SIGTERM)
     try:
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
+        await asyncio.Future()
+    finally:
         print("\nStopping event monitoring...")
         await zen.stop()
 
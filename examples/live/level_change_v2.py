@@ -7,28 +7,26 @@ ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-import yaml
-
 from zencontrol import ZenAddress
 from zencontrol.interface import EntityContext
 from zencontrol.api.commands import ZenCommandClient
 from zencontrol.api.event_decode import ZenEventCode
 from zencontrol.api.types import ZenAddressType
 from run_main import run_with_keyboard_interrupt
-CONFIG_PATH = Path(__file__).resolve().parents[2] / "tests" / "config.yaml"
+from live_config import load_controller_config
 ECG_ADDRESS = 33
 TIMEOUT_SECONDS = 5.0
 
 
 async def test_level_change_v2():
-    config = yaml.safe_load(CONFIG_PATH.read_text())
+    ctrl_config = load_controller_config()
     level = random.randint(100, 250)
     event_received = asyncio.Event()
     received: dict = {}
 
     async with ZenCommandClient(print_traffic=True) as tpi:
         ctx = EntityContext(commands=tpi)
-        ctrl = ctx.ctrl(**config["zencontrol"][0])
+        ctrl = ctx.ctrl(**ctrl_config)
 
         original_process = tpi._process_zen_event
 
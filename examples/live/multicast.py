@@ -5,22 +5,21 @@ _EXAMPLES = Path(__file__).resolve().parent.parent
 if str(_EXAMPLES) not in sys.path:
     sys.path.insert(0, str(_EXAMPLES))
 from run_main import run_with_keyboard_interrupt
+from live_config import load_controller_config
 
 import asyncio
-import yaml
-from pathlib import Path
-from zencontrol import Transport, ZenCommandClient, ZenAddress, ZenInstance, ZenEventMode
+from zencontrol import Transport, ZenCommandClient, ZenEventMode
 from zencontrol.interface import EntityContext
 
 async def main():
     """Test multicast event monitoring"""
     # Load configuration
-    config = yaml.safe_load(open(Path(__file__).resolve().parents[2] / "tests" / "config.yaml"))
+    ctrl_config = load_controller_config()
     
     # Create protocol and controller
     async with ZenCommandClient(print_traffic=True) as tpi:
         ctx = EntityContext(commands=tpi)
-        ctrl = ctx.ctrl(**config.get('zencontrol')[0])
+        ctrl = ctx.ctrl(**ctrl_config)
         
         print("Testing multicast event monitoring...")
         print("=" * 50)
@@ -44,9 +43,8 @@ async def main():
             
             # Keep the event loop running
             try:
-                while True:
-                    await asyncio.sleep(1)
-            except KeyboardInterrupt:
+                await asyncio.Future()  # run until cancelled
+            finally:
                 print("\nStopping event monitoring...")
                 await tpi.stop_event_monitoring()
                 print("Event monitoring stopped.")
@@ -1,16 +1,35 @@
 #!/usr/bin/env python3
 import argparse
 import socket
-import struct
+import sys
 import time
 
+# Linux option numbers the socket module does not export
+SO_RCVBUFFORCE = 33  # <asm-generic/socket.h>
+IP_MULTICAST_ALL = 49  # <linux/in.h>
+
+BATCH_SIZE = 64  # datagrams drained per wakeup before printing
+
+# Printable ASCII maps to itself, everything else to "."
+_ASCII_TABLE = bytes(c if 32 <= c < 127 else 0x2E for c in range(256))
+
+_ts_cache = (0, "")
+
+def timestamp() -> str:
+    """Local wall-clock stamp; strftime runs at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+    return _ts_cache[1]
+
 def hexdump(b: bytes) -> str:
     width = 16
     lines = []
     for i in range(0, len(b), width):
         chunk = b[i:i+width]
-        hexpart = " ".join(f"{x:02x}" for x in chunk)
-        asciipart = "".join(chr(x) if 32 <= x < 127 else "." for x in chunk)
+        hexpart = chunk.hex(" ")
+        asciipart = chunk.translate(_ASCII_TABLE).decode("ascii")
         lines.append(f"{i:04x}  {hexpart:<{width*3}}  {asciipart}")
     return "\n".join(lines)
 
@@ -21,7 +40,7 @@ def main():
     ap.add_argument("--iface-ip", default="0.0.0.0",
                     help="Local interface IP to join on (e.g., your en0 address). "
                          "Use 0.0.0.0 for system default.")
-    ap.add_argument("--buf", type=int, default=262144, help="Receive buffer size (bytes)")
+    ap.add_argument("--buf", type=int, default=12_582_912, help="Receive buffer size (bytes)")
     ap.add_argument("--hex", action="store_true", help="Hexdump payloads")
     args = ap.parse_args()
 
@@ -38,33 +57,70 @@ def main():
         pass  # Not available on all platforms
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
-    # Bigger RX buffer helps with bursts
-    try:
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, args.buf)
-    except OSError:
-        pass
+    # Bigger RX buffer helps with bursts. Linux clamps SO_RCVBUF to
+    # net.core.rmem_max (SO_RCVBUFFORCE, CAP_NET_ADMIN, is not clamped);
+    # macOS/BSD reject sizes above kern.ipc.maxsockbuf with ENOBUFS, so
+    # halve until the kernel accepts one.
+    size = args.buf
+    while size >= 4096:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+            break
+        except OSError:
+            size //= 2
+    if size < args.buf:
+        print(f"Receive buffer of {args.buf} bytes refused; using {size if size >= 4096 else 'OS default'}")
+    if sys.platform.startswith("linux"):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, args.buf)
+        except OSError:
+            pass
+    rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    print(f"Receive buffer: {rcvbuf} bytes")
+    # Linux reports double the usable size; rmem_max is a Linux sysctl.
+    if sys.platform.startswith("linux") and rcvbuf < args.buf:
+        print(f"  (clamped; raise with: sysctl -w net.core.rmem_max={args.buf})")
 
     # Bind to port on all interfaces; do NOT bind to the group address
     sock.bind(("", args.port))
 
     # Join the multicast group on the specified interface IP
     # struct ip_mreq: { struct in_addr imr_multiaddr; struct in_addr imr_interface; }
-    mreq = struct.pack("=4s4s", group, iface)
+    mreq = group + iface
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
 
+    # Linux otherwise delivers every group joined by any socket on the host
+    # to a socket bound to this port; keep it to the group joined above.
+    if sys.platform.startswith("linux"):
+        try:
+            sock.setsockopt(socket.IPPROTO_IP, IP_MULTICAST_ALL, 0)
+        except OSError:
+            pass
+
     # Optional: disable loopback if you don’t want to see your own sends
     # sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
 
     print(f"Joined {args.group}:{args.port} on interface {args.iface_ip}")
     print("Waiting for packets… Ctrl+C to stop.")
 
+    # One receive buffer for the whole run; each wakeup drains up to
+    # BATCH_SIZE queued datagrams (MSG_DONTWAIT) and prints them in one write.
+    buf = bytearray(65535)
+    view = memoryview(buf)
     try:
         while True:
-            data, addr = sock.recvfrom(65535)
-            ts = time.strftime("%Y-%m-%d %H:%M:%S")
-            print(f"[{ts}] from {addr[0]}:{addr[1]}  len={len(data)}")
-            if args.hex:
-                print(hexdump(data))
+            flags = 0
+            out = []
+            for _ in range(BATCH_SIZE):
+                try:
+                    n, addr = sock.recvfrom_into(buf, 0, flags)
+                except BlockingIOError:
+                    break
+                flags = socket.MSG_DONTWAIT
+                out.append(f"[{timestamp()}] from {addr[0]}:{addr[1]}  len={n}")
+                if args.hex:
+                    out.append(hexdump(bytes(view[:n])))
+            print("\n".join(out))
     except KeyboardInterrupt:
         pass
     finally:
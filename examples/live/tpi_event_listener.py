@@ -19,8 +19,10 @@ from run_main import run_with_keyboard_interrupt
 
 import asyncio
 import logging
+import operator
 import socket
 import time
+from functools import reduce
 
 from zencontrol import Transport, ZenEvent
 from zencontrol.api.event_router import ZenEventReceiver
@@ -49,6 +51,9 @@ _EVENT_NAMES = (
 
 
 def _log_event(event: ZenEvent) -> None:
+    # payload.hex() / mac.hex() run eagerly; skip them when INFO is off.
+    if not logger.isEnabledFor(logging.INFO):
+        return
     name = (
         _EVENT_NAMES[event.code]
         if event.code < len(_EVENT_NAMES)
@@ -73,10 +78,7 @@ def _make_packet(mac: str, code: int, target: int, payload: bytes) -> bytes:
     body.append(code)
     body.append(len(payload))
     body.extend(payload)
-    checksum = 0
-    for b in body:
-        checksum ^= b
-    body.append(checksum & 0xFF)
+    body.append(reduce(operator.xor, body, 0))
     return bytes(body)
 
 
@@ -104,8 +106,7 @@ async def _listen(*, unicast: bool, listen_port: int = 6969) -> None:
             EventConst.MULTICAST_PORT,
         )
     try:
-        while True:
-            await asyncio.sleep(3600)
+        await asyncio.Future()  # run until cancelled
     finally:
         await lease.release()
         await receiver.close()
@@ -134,11 +135,11 @@ async def _validate() -> None:
             _make_packet("aa:bb:cc:dd:ee:ff", 0x03, 0, b"\x80"),
             _make_packet("aa:bb:cc:dd:ee:ff", 0x05, 0, b"\x01"),
         ]
+        # Back-to-back; the receive queue holds them until the loop reads.
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
             for packet in packets:
                 sock.sendto(packet, ("127.0.0.1", 6969))
-                await asyncio.sleep(0.05)
         finally:
             sock.close()
 
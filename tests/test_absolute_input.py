@@ -125,3 +125,16 @@ async def test_absolute_input_singleton_per_protocol() -> None:
     b = zen.ctx.absolute_input(instance)
     assert a is b
     assert ("house", 0, 1) in zen.ctx.registry.absolute_inputs
+
+
+def test_absolute_input_hydrates_from_serialized_bytes() -> None:
+    zen = ZenControl()
+    _ctrl, instance = _ecd_instance(zen)
+    absolute = zen.ctx.absolute_input(instance)
+    assert absolute.interview_hydrate({"serial": "1", "label": "Panel", "instance_label": "Dial"})
+    stored = absolute.interview_serialize().encode()
+
+    absolute._reset()
+    assert absolute.interview_hydrate(stored)
+    assert absolute.label == "Panel"
+    assert absolute.instance_label == "Dial"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from zencontrol.api.models import ZenAddress, ZenInstance
@@ -109,6 +111,22 @@ def test_cached_instance_entity_keeps_interviewed_instance(factory_name: str) ->
     zen.clear_entity_caches()
 
 
+@pytest.mark.asyncio
+async def test_get_instances_uses_context_factory_overrides() -> None:
+    zen = ZenControl()
+    ctrl = zen.add_controller(id=1, name="ctrl", label="Ctrl", host="127.0.0.1")
+    address = ZenAddress(ctrl=ctrl, type=ZenAddressType.ECD, number=4)
+    instance = ZenInstance(address=address, type=ZenInstanceType.PUSH_BUTTON, number=2)
+    zen.commands.query_dali_addresses_with_instances = AsyncMock(return_value=[address])  # type: ignore[method-assign]
+    zen.commands.query_instances_by_address = AsyncMock(return_value=[instance])  # type: ignore[method-assign]
+    sentinel = object()
+    zen.ctx.create_button = AsyncMock(return_value=sentinel)  # type: ignore[method-assign]
+
+    assert await zen.get_instances() == {sentinel}
+    zen.ctx.create_button.assert_awaited_once_with(instance)
+    zen.clear_entity_caches()
+
+
 def test_cached_system_variable_accepts_explicit_value_and_label_updates() -> None:
     zen = ZenControl()
     ctrl = zen.add_controller(id=1, name="ctrl", label="Ctrl", host="127.0.0.1")
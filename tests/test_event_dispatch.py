@@ -13,6 +13,7 @@ from zencontrol.api.event_decode import (
     GroupOccupied,
     LevelChange,
     LevelChangeV2,
+    SceneChange,
 )
 from zencontrol.api.types import ZenAddressType
 from zencontrol.interface.interface import ZenControl
@@ -181,3 +182,28 @@ async def test_dispatch_drops_unused_and_deprecated_event_kinds() -> None:
     await zen._dispatcher.dispatch(ctrl, GroupOccupied(target=64, occupied=True))
     assert light.level == 10
     assert called is False
+
+
+@pytest.mark.asyncio
+async def test_repeated_scene_event_notifies_once() -> None:
+    from zencontrol import ZenAddress
+
+    zen = ZenControl()
+    ctrl = zen.add_controller(id=1, name="house", label="House", host="127.0.0.1", mac="02:00:00:00:00:01")
+    light = zen.ctx.light(
+        ZenAddress(ctrl=ctrl, type=ZenAddressType.ECG, number=5),
+    )
+    light._scene_levels[2] = 200
+    changes = 0
+
+    async def on_light_change(**kwargs) -> None:
+        nonlocal changes
+        changes += 1
+
+    zen.callbacks.light_change = on_light_change
+
+    await zen._dispatcher.dispatch(ctrl, SceneChange(target=5, scene=2, active=True))
+    await zen._dispatcher.dispatch(ctrl, SceneChange(target=5, scene=2, active=True))
+    assert light.scene == 2
+    assert light.level == 200
+    assert changes == 1
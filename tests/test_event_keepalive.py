@@ -64,6 +64,21 @@ async def test_assert_defers_while_controller_not_ready() -> None:
     zen.configure_controller_events.assert_not_awaited()
     zen.commands.query_tpi_event_unicast_address.assert_not_awaited()
     status_cb.assert_awaited_once_with(ctrl, "starting")
+    assert ctrl.name in zen._controllers_starting
+
+
+@pytest.mark.asyncio
+async def test_assert_forgets_starting_when_monitoring_inactive() -> None:
+    zen = ZenControl()
+    zen.is_event_monitoring_active = lambda: True  # type: ignore[method-assign]
+    ctrl = _controller()
+    zen.commands.query_controller_startup_complete = AsyncMock(return_value=False)
+    await zen.assert_controller_events(ctrl)  # type: ignore[arg-type]
+    assert ctrl.name in zen._controllers_starting
+
+    zen.is_event_monitoring_active = lambda: False  # type: ignore[method-assign]
+    assert await zen.assert_controller_events(ctrl) is False  # type: ignore[arg-type]
+    assert ctrl.name not in zen._controllers_starting
 
 
 @pytest.mark.asyncio
@@ -215,3 +230,53 @@ async def test_keepalive_loop_reasserts_and_stops_cleanly() -> None:
 
     await zen.stop()
     assert zen._keepalive_task is None or zen._keepalive_task.done()
+
+
+@pytest.mark.asyncio
+async def test_keepalive_polls_eagerly_while_controller_starting() -> None:
+    zen = ZenControl()
+    zen.event_keepalive_interval = 0.2
+    zen.event_startup_poll_min_delay = 0.01
+    zen.reconnect_min_delay = 0.01
+    ctrl = _controller()
+    zen.add_controller(
+        id=1,
+        name=ctrl.name,
+        label="Controller",
+        host="127.0.0.1",
+        mac=ctrl.mac,
+    )
+
+    loop = asyncio.get_running_loop()
+    polled_at: list[float] = []
+
+    async def still_starting(_ctrl: object) -> bool:
+        polled_at.append(loop.time())
+        return False
+
+    startup = AsyncMock(side_effect=still_starting)
+    zen.commands.query_controller_startup_complete = startup
+    zen.commands.set_tpi_event_unicast_address = AsyncMock()
+    zen.commands.tpi_event_emit = AsyncMock(return_value=True)
+
+    zen.event_receiver._endpoint_factory = fake_endpoint_factory()
+    await zen.start()
+    # One full interval, then 0.01 + 0.02 + 0.04 s backoff - well under a second interval.
+    for _ in range(50):
+        if startup.await_count >= 4:
+            break
+        await asyncio.sleep(0.01)
+    else:
+        pytest.fail("keepalive did not back off while controller was starting")
+
+    # Backoff holds at the interval rather than restarting from the minimum.
+    for _ in range(300):
+        if startup.await_count >= 10:
+            break
+        await asyncio.sleep(0.01)
+    else:
+        pytest.fail("keepalive stopped polling while controller was starting")
+    gaps = [b - a for a, b in zip(polled_at, polled_at[1:])]
+    assert min(gaps[-2:]) >= zen.event_keepalive_interval * 0.9
+
+    await zen.stop()
@@ -24,3 +24,18 @@ def test_blind_position_linear() -> None:
     assert ZenBlind.arc_for_position(0) == 0
     assert ZenBlind.arc_for_position(100) == 254
     assert ZenBlind.arc_for_position(50) == 127
+
+
+def test_blind_position_tables_match_linear_map() -> None:
+    for arc in range(1, 254):
+        assert ZenBlind.position_from_arc(arc) == round(arc / 254 * 100)
+    for position in range(1, 100):
+        assert ZenBlind.arc_for_position(position) == round(position / 100 * 254)
+    assert ZenBlind.position_from_arc(-1) == 0
+    assert ZenBlind.position_from_arc(300) == 100
+
+
+def test_blind_position_accepts_float() -> None:
+    assert ZenBlind.arc_for_position(50.0) == 127
+    assert ZenBlind.arc_for_position(50.5) == round(50.5 / 100 * 254)
+    assert ZenBlind.arc_for_position(100.0) == 254
@@ -11,7 +11,8 @@ from helpers_endpoints import fake_endpoint_factory
 
 from zencontrol.api.commands import ZenCommandClient
 from zencontrol.api.event_router import DEFAULT_MAX_QUEUE_SIZE, ZenEventReceiver
-from zencontrol.api.types import Transport
+from zencontrol.api.models import ZenAddress
+from zencontrol.api.types import Transport, ZenAddressType, ZenCgType
 from zencontrol.exceptions import ZenTimeoutError
 from zencontrol.interface import EntityContext
 from zencontrol.io.command import ZenClient
@@ -160,6 +161,14 @@ def test_resolve_host_sync_skips_dns_for_ipv4_literal() -> None:
         dns.assert_not_called()
 
 
+def test_is_ipv4_address_rejects_non_literals() -> None:
+    from zencontrol.utils import is_ipv4_address
+
+    assert is_ipv4_address("10.0.0.1")
+    for host in ("ctrl.local", "10.0.1", "010.0.0.1", "256.0.0.1", " 10.0.0.1", "::1", ""):
+        assert not is_ipv4_address(host), host
+
+
 @pytest.mark.asyncio
 async def test_resolve_host_runs_dns_in_executor() -> None:
     from zencontrol.utils import resolve_host
@@ -388,3 +397,59 @@ def test_mac_requires_six_bytes() -> None:
         mac="aa:bb:cc:dd:ee:ff",
     )
     assert ctrl.mac_bytes == bytes.fromhex("aabbccddeeff")
+
+
+@pytest.mark.asyncio
+async def test_group_membership_mask_decodes_ascending() -> None:
+    client = ZenCommandClient()
+    ctx = EntityContext(commands=client)
+    ctrl = ctx.ctrl(id=1, name="c", label="C", host="127.0.0.1", port=5108)
+    # High byte = groups 8-15, low byte = groups 0-7.
+    client._send_basic = AsyncMock(  # type: ignore[method-assign]
+        return_value=ZenResponse(ZenResponseType.ANSWER, data=bytes([0x81, 0x03]))
+    )
+    addr = ZenAddress(ctrl=ctrl, type=ZenAddressType.ECG, number=4)
+
+    groups = await client.query_group_membership_by_address(addr)
+
+    assert [g.number for g in groups] == [0, 1, 8, 15]
+    assert all(g.type == ZenAddressType.GROUP and g.ctrl is ctrl for g in groups)
+
+
+@pytest.mark.asyncio
+async def test_light_interview_does_not_flood_controller() -> None:
+    client = ZenCommandClient()
+    ctx = EntityContext(commands=client)
+    ctrl = ctx.ctrl(id=1, name="c", label="C", host="127.0.0.1", port=5108)
+    addr = ZenAddress(ctrl=ctrl, type=ZenAddressType.ECG, number=4)
+    in_flight = 0
+
+    def busy_controller(answer: object) -> AsyncMock:
+        # Overlapping requests fail like QUEUE_FAILURE after retries: None.
+        async def query(*_args: object) -> object:
+            nonlocal in_flight
+            in_flight += 1
+            try:
+                await asyncio.sleep(0)
+                return None if in_flight > 1 else answer
+            finally:
+                in_flight -= 1
+
+        return AsyncMock(side_effect=query)
+
+    levels = [254] + [None] * 11
+    client.dali_query_control_gear_status = busy_controller(object())  # type: ignore[method-assign]
+    client.query_dali_device_label = busy_controller("Kitchen")  # type: ignore[method-assign]
+    client.query_dali_serial = busy_controller(1234)  # type: ignore[method-assign]
+    client.query_dali_ean = busy_controller(5678)  # type: ignore[method-assign]
+    client.dali_query_cg_type = busy_controller([ZenCgType.LED])  # type: ignore[method-assign]
+    client.query_scene_levels_by_address = busy_controller(levels)  # type: ignore[method-assign]
+    client.query_scene_colours_by_address = busy_controller([])  # type: ignore[method-assign]
+    client.query_group_membership_by_address = busy_controller([])  # type: ignore[method-assign]
+
+    light = ctx.light(addr)
+    assert await light.interview() is True
+
+    assert (light.label, light.serial, light.ean) == ("Kitchen", 1234, 5678)
+    assert light.features["brightness"] is True
+    assert light._scene_levels == levels
@@ -370,7 +370,7 @@ class ZenCommandClient:
                     if error_code
                     else (f"Unknown error code: {hex(code)}" if code is not None else "no error code")
                 )
-                self.logger.error(f"Command error code: {label}")
+                self.logger.error("Command error code: %s", label)
 
     # ============================
     # RESPONSE PARSERS
@@ -776,25 +776,13 @@ class ZenCommandClient:
         """Query an address (ECG) for which DALI groups it belongs to. Returns a list of ZenAddress group instances."""
         response = self._response_to_bytes_or_none(await self._send_basic(address.ctrl, CMD.QUERY_GROUP_MEMBERSHIP_BY_ADDRESS, address.ecg()))
         if response and len(response) == 2:
-            groups = []
-            # Process high byte (groups 8-15)
-            for i in range(8):
-                if response[0] & (1 << i):
-                    groups.append(i + 8)
-            # Process low byte (groups 0-7)  
-            for i in range(8):
-                if response[1] & (1 << i):
-                    groups.append(i)
-            # Process into ZenAddress instances
-            groups.sort()
-            zen_groups: list[ZenAddress] = []
-            for number in groups:
-                zen_groups.append(ZenAddress(
-                    ctrl=address.ctrl,
-                    type=ZenAddressType.GROUP,
-                    number=number
-                ))
-            return zen_groups
+            # 16-bit membership mask, high byte = groups 8-15; bit order gives ascending numbers.
+            mask = (response[0] << 8) | response[1]
+            return [
+                ZenAddress(ctrl=address.ctrl, type=ZenAddressType.GROUP, number=number)
+                for number in range(16)
+                if mask & (1 << number)
+            ]
         return []
 
     async def query_dali_addresses_with_instances(self, ctrl: ControllerRef, start_address: int | None = None) -> list[ZenAddress]:
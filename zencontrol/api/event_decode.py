@@ -196,6 +196,9 @@ ZenDecodedEvent = (
     | LevelChangeV2
 )
 
+# Wire byte -> member, so unknown codes are a dict miss rather than a raised ValueError.
+_EVENT_CODES: dict[int, ZenEventCode] = {code.value: code for code in ZenEventCode}
+
 
 def decode_zen_event(event: ZenEvent) -> ZenDecodedEvent | None:
     """Interpret event code and payload. Returns None if unknown or wrong length.
@@ -204,9 +207,8 @@ def decode_zen_event(event: ZenEvent) -> ZenDecodedEvent | None:
     checksummed frame is rejection, not silent ignore. COLOUR_CHANGE is
     variable (3-7 bytes) per DALI colour type.
     """
-    try:
-        code = ZenEventCode(event.code)
-    except ValueError:
+    code = _EVENT_CODES.get(event.code)
+    if code is None:
         return None
 
     payload = event.payload
@@ -471,7 +471,7 @@ class ZenEventReceiver:
             if not unexpected:
                 raise
         except Exception as err:
-            self.logger.error(f"Event funnel consumer error: {err}", exc_info=True)
+            self.logger.error("Event funnel consumer error: %s", err, exc_info=True)
         finally:
             if unexpected:
                 if callable(self.on_unexpected_exit):
@@ -480,7 +480,7 @@ class ZenEventReceiver:
                     except asyncio.CancelledError:
                         raise
                     except Exception as err:
-                        self.logger.error(f"on_unexpected_exit error: {err}", exc_info=True)
+                        self.logger.error("on_unexpected_exit error: %s", err, exc_info=True)
                 # Leases and subscriptions survive; re-open transports (I10).
                 if any(self._refcounts.values()):
                     self._schedule_recover()
@@ -551,7 +551,7 @@ class ZenEventReceiver:
                 except asyncio.CancelledError:
                     raise
                 except Exception as err:
-                    self.logger.error(f"on_session_restored error: {err}", exc_info=True)
+                    self.logger.error("on_session_restored error: %s", err, exc_info=True)
                 return
 
             self.logger.warning(
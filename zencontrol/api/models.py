@@ -31,6 +31,28 @@ from .types import ZenAddressType, ZenColourType, ZenInstanceType
 
 DEFAULT_CONTROLLER_PORT = 5108
 
+# Entity-id prefixes ("ecg", "group", ...) built once rather than casefolded per call.
+_ENTITY_ID_PREFIX = {t: t.name.casefold() for t in ZenAddressType}
+
+# Every valid address id ("ecg0".."ecg63", "group0".."group15", ...) formatted once at import.
+_ADDRESS_NUMBERS = {
+    ZenAddressType.BROADCAST: (255,),
+    ZenAddressType.ECG: range(64),
+    ZenAddressType.ECD: range(64),
+    ZenAddressType.GROUP: range(16),
+}
+_ENTITY_IDS = {(t, n): f"{_ENTITY_ID_PREFIX[t]}{n}" for t, numbers in _ADDRESS_NUMBERS.items() for n in numbers}
+
+# Wire-byte offset per accepted address type, one table per ZenAddress accessor.
+# Broadcast is always number 255, so offset 0 yields the 0xFF wire byte.
+_ECG = {ZenAddressType.ECG: 0}
+_ECD = {ZenAddressType.ECD: 64}
+_GROUP = {ZenAddressType.GROUP: 0}
+_ECG_OR_GROUP = {ZenAddressType.ECG: 0, ZenAddressType.GROUP: 64}
+_ECG_OR_GROUP_OR_BROADCAST = {**_ECG_OR_GROUP, ZenAddressType.BROADCAST: 0}
+_ECG_OR_ECD = {ZenAddressType.ECG: 0, ZenAddressType.ECD: 64}
+_ECG_OR_ECD_OR_BROADCAST = {**_ECG_OR_ECD, ZenAddressType.BROADCAST: 0}
+
 
 class ControllerRef(Protocol):
     """What the API layer needs from a controller (address + command path).
@@ -173,58 +195,39 @@ class ZenAddress:
     def broadcast(cls, ctrl: ControllerRef) -> Self:
         return cls(ctrl=ctrl, type=ZenAddressType.BROADCAST, number=255)
     
+    def _wire_byte(self, offsets: dict[ZenAddressType, int], expected: str) -> int:
+        offset = offsets.get(self.type)
+        if offset is None:
+            raise ValueError(f"Address is {self.type.name}, expected {expected}")
+        return self.number + offset
+
     def ecg(self) -> int:
-        if self.type == ZenAddressType.ECG: return self.number
-        if self.type == ZenAddressType.ECD: raise ValueError("Address is ECD, expected ECG")
-        if self.type == ZenAddressType.GROUP: raise ValueError("Address is GROUP, expected ECG")
-        if self.type == ZenAddressType.BROADCAST: raise ValueError("Address is BROADCAST, expected ECG")
-        raise ValueError("Address type is unknown, expected ECG")
-    
+        return self._wire_byte(_ECG, "ECG")
+
     def ecg_or_group(self) -> int:
-        if self.type == ZenAddressType.ECG: return self.number
-        if self.type == ZenAddressType.GROUP: return self.number+64
-        if self.type == ZenAddressType.ECD: raise ValueError("Address is ECD, expected ECG or GROUP")
-        if self.type == ZenAddressType.BROADCAST: raise ValueError("Address is BROADCAST, expected ECG or GROUP")
-        raise ValueError("Address type is unknown, expected ECG or GROUP")
-    
+        return self._wire_byte(_ECG_OR_GROUP, "ECG or GROUP")
+
     def ecg_or_group_or_broadcast(self) -> int:
-        if self.type == ZenAddressType.ECG: return self.number
-        if self.type == ZenAddressType.GROUP: return self.number+64
-        if self.type == ZenAddressType.BROADCAST: return 255
-        if self.type == ZenAddressType.ECD: raise ValueError("Address is ECD, expected ECG or GROUP")
-        raise ValueError("Address type is unknown, expected ECG, GROUP or BROADCAST")
-    
+        return self._wire_byte(_ECG_OR_GROUP_OR_BROADCAST, "ECG, GROUP or BROADCAST")
+
     def ecg_or_ecd(self) -> int:
-        if self.type == ZenAddressType.ECG: return self.number
-        if self.type == ZenAddressType.ECD: return self.number+64
-        if self.type == ZenAddressType.GROUP: raise ValueError("Address is GROUP, expected ECG or ECD")
-        if self.type == ZenAddressType.BROADCAST: raise ValueError("Address is BROADCAST, expected ECG or ECD")
-        raise ValueError("Address type is unknown, expected ECG or ECD")
-    
+        return self._wire_byte(_ECG_OR_ECD, "ECG or ECD")
+
     def ecg_or_ecd_or_broadcast(self) -> int:
-        if self.type == ZenAddressType.ECG: return self.number
-        if self.type == ZenAddressType.ECD: return self.number+64
-        if self.type == ZenAddressType.BROADCAST: return 255
-        if self.type == ZenAddressType.GROUP: raise ValueError("Address is GROUP, expected ECG or ECD or BROADCAST")
-        raise ValueError("Address type is unknown, expected ECG, ECD or BROADCAST")
-    
+        return self._wire_byte(_ECG_OR_ECD_OR_BROADCAST, "ECG, ECD or BROADCAST")
+
     def ecd(self) -> int:
-        if self.type == ZenAddressType.ECD: return self.number+64
-        if self.type == ZenAddressType.ECG: raise ValueError("Address is ECG, expected ECD")
-        if self.type == ZenAddressType.GROUP: raise ValueError("Address is GROUP, expected ECD")
-        if self.type == ZenAddressType.BROADCAST: raise ValueError("Address is BROADCAST, expected ECD")
-        raise ValueError("Address type is unknown, expected ECD")
-    
+        return self._wire_byte(_ECD, "ECD")
+
     def group(self) -> int:
-        if self.type == ZenAddressType.GROUP: return self.number
-        if self.type == ZenAddressType.ECG: raise ValueError("Address is ECG, expected GROUP")
-        if self.type == ZenAddressType.ECD: raise ValueError("Address is ECD, expected GROUP")
-        if self.type == ZenAddressType.BROADCAST: raise ValueError("Address is BROADCAST, expected GROUP")
-        raise ValueError("Address type is unknown, expected GROUP")
+        return self._wire_byte(_GROUP, "GROUP")
 
     def entity_id_string(self) -> str:
         """Return a stable HA-friendly identifier for this address."""
-        return f"{self.type.name.casefold()}{self.number}"
+        entity_id = _ENTITY_IDS.get((self.type, self.number))
+        if entity_id is None:
+            entity_id = f"{_ENTITY_ID_PREFIX[self.type]}{self.number}"
+        return entity_id
     
     def __post_init__(self) -> None:
         match self.type:
@@ -276,6 +279,12 @@ class ZenInstance:
         return f"{self.address.entity_id_string()}_{self.number}"
 
 
+# Colour payload layouts, compiled once instead of re-parsing the format per to_bytes().
+_TC_FRAME = struct.Struct(">BH")
+_XY_FRAME = struct.Struct(">BHH")
+_RGBWAF_FRAME = struct.Struct("BBBBBBB")
+
+
 @dataclass(frozen=True, slots=True)
 class ZenTcColour:
     """Tunable-white colour temperature in kelvin."""
@@ -295,7 +304,7 @@ class ZenTcColour:
 
     def to_bytes(self) -> bytes:
         """Encode as returned by QUERY_DALI_COLOUR (no address or arc level)."""
-        return struct.pack(">BH", ZenColourType.TC.value, self.kelvin)
+        return _TC_FRAME.pack(ZenColourType.TC.value, self.kelvin)
 
 
 @dataclass(frozen=True, slots=True)
@@ -313,7 +322,7 @@ class ZenXyColour:
 
     def to_bytes(self) -> bytes:
         """Encode as returned by QUERY_DALI_COLOUR (no address or arc level)."""
-        return struct.pack(">BHH", ZenColourType.XY.value, self.x, self.y)
+        return _XY_FRAME.pack(ZenColourType.XY.value, self.x, self.y)
 
 
 @dataclass(frozen=True, slots=True)
@@ -346,8 +355,7 @@ class ZenRgbColour:
 
         Missing W/A/F channels encode as 0xFF (unused / no change).
         """
-        return struct.pack(
-            "BBBBBBB",
+        return _RGBWAF_FRAME.pack(
             ZenColourType.RGBWAF.value,
             self.r,
             self.g,
@@ -17,6 +17,9 @@ class Const:
     # Periodic emit-state check - controllers that reboot while our listener
     # stays up lose TPI event config until we re-assert it.
     EVENT_KEEPALIVE_INTERVAL = 30.0
+    # While a controller reports startup incomplete, re-check from this delay,
+    # doubling up to EVENT_KEEPALIVE_INTERVAL.
+    EVENT_STARTUP_POLL_MIN_DELAY = 1.0
 
     # Colour-temp fallbacks when QUERY_DALI_COLOUR_TEMP_LIMITS fails
     DEFAULT_WARMEST_TEMP = 2700
@@ -447,7 +447,7 @@ class EntityContext:
             return
         exc = task.exception()
         if exc is not None:
-            self.logger.error(f"Background task failed: {exc}", exc_info=exc)
+            self.logger.error("Background task failed: %s", exc, exc_info=exc)
 
     @staticmethod
     async def cancel_and_await(task: asyncio.Task[Any] | None) -> None:
@@ -49,14 +49,14 @@ class EventDispatcher:
     ) -> ZenInstance | None:
         address = ecd_address_from_target(ctrl, target)
         if address is None:
-            self.logger.error(f"Invalid ECD event target: {target}")
+            self.logger.error("Invalid ECD event target: %s", target)
             return None
         return ZenInstance(address=address, type=instance_type, number=number)
 
     def _ecg_or_group(self, ctrl: ZenController, target: int) -> ZenAddress | None:
         address = ecg_or_group_address_from_target(ctrl, target)
         if address is None:
-            self.logger.error(f"Invalid gear/group event target: {target}")
+            self.logger.error("Invalid gear/group event target: %s", target)
         return address
 
     async def handle(self, ctrl: SuperZenController, ev: ZenDecodedEvent) -> None:
@@ -9,6 +9,7 @@ from collections.abc import Coroutine
 from typing import Any, cast
 
 from ..api import (
+    ControllerRef,
     ZenRgbColour,
     ZenTcColour,
     ZenXyColour,
@@ -31,6 +32,10 @@ def _serialize_group_address(address: ZenAddress) -> dict[str, int]:
     return {"number": address.number}
 
 
+def _group_membership_from_data(ctrl: ControllerRef, raw: list[dict[str, int]]) -> list[ZenAddress]:
+    return [ZenAddress(ctrl=ctrl, type=ZenAddressType.GROUP, number=group["number"]) for group in raw]
+
+
 def _cgtypes_from_data(raw: list[Any]) -> list[ZenCgType]:
     types: list[ZenCgType] = []
     for item in raw:
@@ -41,8 +46,9 @@ def _cgtypes_from_data(raw: list[Any]) -> list[ZenCgType]:
     return types
 
 
-def _loads_interview_data(data: str | dict[str, Any]) -> dict[str, Any]:
-    if isinstance(data, str):
+def _loads_interview_data(data: str | bytes | dict[str, Any]) -> dict[str, Any]:
+    # json.loads reads UTF-8 bytes directly; callers need not decode stored payloads.
+    if isinstance(data, (str, bytes)):
         loaded: dict[str, Any] = json.loads(data)
         return loaded
     return data
@@ -164,7 +170,7 @@ class ZenProfile:
             "number": self.number,
             "label": self.label,
         })
-    def interview_hydrate(self, data: str | dict[str, Any]) -> bool:
+    def interview_hydrate(self, data: str | bytes | dict[str, Any]) -> bool:
         try:
             data = _loads_interview_data(data)
             self.label = data.get("label")
@@ -266,15 +272,20 @@ class ZenControlGear:
 
     async def _handle_scene_changed(self, scene: int, active: bool, cascaded_from: ZenGroup | None = None) -> None:
         if active:
+            # Controllers repeat scene events (re-recall, fades); only notify on a real change.
+            changed = scene != self.scene
             self.scene = scene
             scene_level = self._scene_levels[scene]
             scene_colour = self._scene_colours[scene]
             if scene_level is not None and scene_level != self.level:
                 self.level = scene_level
+                changed = True
             if scene_colour is not None and scene_colour != self.colour:
                 self.colour = scene_colour
+                changed = True
             await self._after_scene_activated(cascaded_from=cascaded_from)
-            await self._notify_state_changed()
+            if changed:
+                await self._notify_state_changed()
             return
         if self.scene is not None:
             self.scene = None
@@ -353,6 +364,25 @@ class ZenLight(ZenControlGear):
     group_membership: list[ZenAddress]
     features: dict[str, bool]
     properties: dict[str, int | None]
+    # Prototypes copied by _reset; never mutate these directly.
+    _FEATURES_DEFAULT: dict[str, bool] = {
+        "brightness": False,
+        "temperature": False,
+        "RGB": False,
+        "RGBW": False,
+        "RGBWW": False,
+        "XY": False,
+    }
+    _PROPERTIES_DEFAULT: dict[str, int | None] = {
+        "min_kelvin": Const.DEFAULT_WARMEST_TEMP,
+        "max_kelvin": Const.DEFAULT_COOLEST_TEMP,
+    }
+    # RGBWAF channel count -> feature flag.
+    _RGBWAF_FEATURE: dict[int, str] = {
+        Const.RGB_CHANNELS: "RGB",
+        Const.RGBW_CHANNELS: "RGBW",
+        Const.RGBWW_CHANNELS: "RGBWW",
+    }
 
     def __init__(self, ctx: EntityContext, address: ZenAddress) -> None:
         self.ctx = ctx
@@ -370,18 +400,8 @@ class ZenLight(ZenControlGear):
         self.cgtype = []
         self.groups = set()
         self.group_membership = []
-        self.features = {
-            "brightness": False,
-            "temperature": False,
-            "RGB": False,
-            "RGBW": False,
-            "RGBWW": False,
-            "XY": False,
-        }
-        self.properties = {
-            "min_kelvin": Const.DEFAULT_WARMEST_TEMP,
-            "max_kelvin": Const.DEFAULT_COOLEST_TEMP,
-        }
+        self.features = dict(self._FEATURES_DEFAULT)
+        self.properties = dict(self._PROPERTIES_DEFAULT)
 
     def _apply_group_membership(self, membership: list[ZenAddress]) -> None:
         for existing_group in self.groups:
@@ -409,7 +429,7 @@ class ZenLight(ZenControlGear):
         })
         return json.dumps(data)
 
-    def interview_hydrate(self, data: str | dict[str, Any]) -> bool:
+    def interview_hydrate(self, data: str | bytes | dict[str, Any]) -> bool:
         try:
             loaded = _loads_interview_data(data)
             self._interview_hydrate_parent(loaded)
@@ -423,17 +443,17 @@ class ZenLight(ZenControlGear):
                 colour_from_bytes(bytes(raw)) if raw is not None else None
                 for raw in loaded.get("scene_colours", [])
             ]
-            membership = [
-                ZenAddress(ctrl=self.address.ctrl, type=ZenAddressType.GROUP, number=group["number"])
-                for group in loaded.get("group_membership", [])
-            ]
-            self._apply_group_membership(membership)
+            self._apply_group_membership(
+                _group_membership_from_data(self.address.ctrl, loaded.get("group_membership", []))
+            )
             return True
         except Exception:  # pylint: disable=broad-exception-caught
             return False
     async def interview(self) -> bool:
         cgstatus = await self.commands.dali_query_control_gear_status(self.address)
         if cgstatus:
+            # Sequential on purpose: a light interview runs for every gear, and a
+            # flooded controller answers None after QUEUE_FAILURE retries.
             if self.label is None:
                 self.label = _or_device_label(await self.commands.query_dali_device_label(self.address), self.address)
             if self.serial is None:
@@ -461,15 +481,9 @@ class ZenLight(ZenControlGear):
                     if colour_temp_limits:
                         self.properties["min_kelvin"] = colour_temp_limits.soft_warmest
                         self.properties["max_kelvin"] = colour_temp_limits.soft_coolest
-                elif cgtype and cgtype.rgbwaf_channels == Const.RGB_CHANNELS:
+                elif cgtype and (rgbwaf := self._RGBWAF_FEATURE.get(cgtype.rgbwaf_channels)):
                     self.features["brightness"] = True
-                    self.features["RGB"] = True
-                elif cgtype and cgtype.rgbwaf_channels == Const.RGBW_CHANNELS:
-                    self.features["brightness"] = True
-                    self.features["RGBW"] = True
-                elif cgtype and cgtype.rgbwaf_channels == Const.RGBWW_CHANNELS:
-                    self.features["brightness"] = True
-                    self.features["RGBWW"] = True
+                    self.features[rgbwaf] = True
             
             # Scenes
             self._scene_levels = await self.commands.query_scene_levels_by_address(self.address)
@@ -579,7 +593,7 @@ class ZenFan(ZenControlGear):
         })
         return json.dumps(data)
 
-    def interview_hydrate(self, data: str | dict[str, Any]) -> bool:
+    def interview_hydrate(self, data: str | bytes | dict[str, Any]) -> bool:
         try:
             loaded = _loads_interview_data(data)
             self._interview_hydrate_parent(loaded)
@@ -588,11 +602,9 @@ class ZenFan(ZenControlGear):
             self.bus_unit = loaded.get("bus_unit")
             self.operating_mode = loaded.get("operating_mode")
             self.cgtype = _cgtypes_from_data(list(loaded.get("cgtype", [])))
-            membership = [
-                ZenAddress(ctrl=self.address.ctrl, type=ZenAddressType.GROUP, number=group["number"])
-                for group in loaded.get("group_membership", [])
-            ]
-            self._apply_group_membership(membership)
+            self._apply_group_membership(
+                _group_membership_from_data(self.address.ctrl, loaded.get("group_membership", []))
+            )
             return True
         except Exception:  # pylint: disable=broad-exception-caught
             return False
@@ -657,6 +669,9 @@ class ZenBlind(ZenControlGear):
     cgtype: list[ZenCgType]
     groups: set[ZenGroup]
     group_membership: list[ZenAddress]
+    # Both directions are tiny closed integer domains; look up instead of float math.
+    _POSITION_BY_ARC: bytes = bytes(round(arc / 254 * 100) for arc in range(255))
+    _ARC_BY_POSITION: bytes = bytes(round(position / 100 * 254) for position in range(101))
 
     def __init__(self, ctx: EntityContext, address: ZenAddress) -> None:
         self.ctx = ctx
@@ -700,7 +715,7 @@ class ZenBlind(ZenControlGear):
         })
         return json.dumps(data)
 
-    def interview_hydrate(self, data: str | dict[str, Any]) -> bool:
+    def interview_hydrate(self, data: str | bytes | dict[str, Any]) -> bool:
         try:
             loaded = _loads_interview_data(data)
             self._interview_hydrate_parent(loaded)
@@ -709,11 +724,9 @@ class ZenBlind(ZenControlGear):
             self.bus_unit = loaded.get("bus_unit")
             self.operating_mode = loaded.get("operating_mode")
             self.cgtype = _cgtypes_from_data(list(loaded.get("cgtype", [])))
-            membership = [
-                ZenAddress(ctrl=self.address.ctrl, type=ZenAddressType.GROUP, number=group["number"])
-                for group in loaded.get("group_membership", [])
-            ]
-            self._apply_group_membership(membership)
+            self._apply_group_membership(
+                _group_membership_from_data(self.address.ctrl, loaded.get("group_membership", []))
+            )
             return True
         except Exception:  # pylint: disable=broad-exception-caught
             return False
@@ -742,22 +755,16 @@ class ZenBlind(ZenControlGear):
         """Linear 0-100 position; None if unknown (incl. MASK 255)."""
         if arc is None or arc == 255:
             return None
-        if arc <= 0:
-            return 0
-        if arc >= 254:
-            return 100
-        return round(arc / 254 * 100)
+        return ZenBlind._POSITION_BY_ARC[min(max(arc, 0), 254)]
 
     @staticmethod
     def arc_for_position(position: int) -> int:
         """Linear position 0-100 → arc 0-254."""
         if not 0 <= position <= 100:
             raise ValueError(f"Position must be 0-100, got {position}")
-        if position <= 0:
-            return 0
-        if position >= 100:
-            return 254
-        return round(position / 100 * 254)
+        if isinstance(position, int):
+            return ZenBlind._ARC_BY_POSITION[position]
+        return round(position / 100 * 254)  # e.g. a float from a UI slider
 
     @property
     def position(self) -> int | None:
@@ -826,7 +833,7 @@ class ZenGroup(ZenControlGear):
         data["scene_labels"] = list(self._scene_labels)
         return json.dumps(data)
 
-    def interview_hydrate(self, data: str | dict[str, Any]) -> bool:
+    def interview_hydrate(self, data: str | bytes | dict[str, Any]) -> bool:
         try:
             loaded = _loads_interview_data(data)
             self._interview_hydrate_parent(loaded)
@@ -953,7 +960,7 @@ class ZenButton(ZenControlDeviceInstance):
     def interview_serialize(self) -> str:
         return json.dumps(self._interview_serialize_parent())
 
-    def interview_hydrate(self, data: str | dict[str, Any]) -> bool:
+    def interview_hydrate(self, data: str | bytes | dict[str, Any]) -> bool:
         try:
             self._interview_hydrate_parent(_loads_interview_data(data))
             return True
@@ -999,7 +1006,7 @@ class ZenAbsoluteInput(ZenControlDeviceInstance):
     def interview_serialize(self) -> str:
         return json.dumps(self._interview_serialize_parent())
 
-    def interview_hydrate(self, data: str | dict[str, Any]) -> bool:
+    def interview_hydrate(self, data: str | bytes | dict[str, Any]) -> bool:
         try:
             self._interview_hydrate_parent(_loads_interview_data(data))
             return True
@@ -1046,7 +1053,7 @@ class ZenMotionSensor(ZenControlDeviceInstance):
         data["hold_time"] = self.hold_time
         return json.dumps(data)
 
-    def interview_hydrate(self, data: str | dict[str, Any]) -> bool:
+    def interview_hydrate(self, data: str | bytes | dict[str, Any]) -> bool:
         try:
             loaded = _loads_interview_data(data)
             self._interview_hydrate_parent(loaded)
@@ -1180,7 +1187,7 @@ class ZenSystemVariable:
         return json.dumps({
             "label": self.label,
         })
-    def interview_hydrate(self, data: str | dict[str, Any]) -> bool:
+    def interview_hydrate(self, data: str | bytes | dict[str, Any]) -> bool:
         try:
             data = _loads_interview_data(data)
             self.label = data.get("label")
@@ -87,6 +87,14 @@ def _assign_light_sub_labels(lights: list[ZenLight] | set[ZenLight]) -> None:
 
 ZenEcdEntity = ZenButton | ZenMotionSensor | ZenAbsoluteInput
 
+# ECD instance type -> EntityContext factory method name; looked up on the
+# context per call so subclass overrides apply. Other types are not modelled.
+_INSTANCE_FACTORIES: dict[ZenInstanceType, str] = {
+    ZenInstanceType.PUSH_BUTTON: "create_button",
+    ZenInstanceType.OCCUPANCY_SENSOR: "create_motion_sensor",
+    ZenInstanceType.ABSOLUTE_INPUT: "create_absolute_input",
+}
+
 
 class ZenControl:
     def __init__(
@@ -116,6 +124,7 @@ class ZenControl:
         self.reconnect_max_delay = Const.RECONNECT_MAX_DELAY
         self.reconnect_healthy_seconds = Const.RECONNECT_HEALTHY_SECONDS
         self.event_keepalive_interval = Const.EVENT_KEEPALIVE_INTERVAL
+        self.event_startup_poll_min_delay = Const.EVENT_STARTUP_POLL_MIN_DELAY
 
         self._dispatcher = EventDispatcher(self.ctx, self.logger)
         self._discovery = ControllerDiscovery(self)
@@ -128,6 +137,7 @@ class ZenControl:
         self._stopping = False
         self._supervisor_task: asyncio.Task[None] | None = None
         self._keepalive_task: asyncio.Task[None] | None = None
+        self._controllers_starting: set[str] = set()
         self._first_connected = asyncio.Event()
         self._session_restored = asyncio.Event()
         self.event_receiver.on_leases_idle = self._session_restored.set
@@ -314,7 +324,7 @@ class ZenControl:
             except asyncio.CancelledError:
                 raise
             except Exception as err:
-                self.logger.warning(f"Failed to attach event bindings: {err}")
+                self.logger.warning("Failed to attach event bindings: %s", err)
                 if self._stopping:
                     return
                 await asyncio.sleep(delay)
@@ -351,7 +361,7 @@ class ZenControl:
                 else:
                     self.logger.error("Event monitor consumer cancelled unexpectedly")
             elif (exc := event_task.exception()) is not None:
-                self.logger.error(f"Event monitor task error: {exc}")
+                self.logger.error("Event monitor task error: %s", exc)
 
             if self._stopping:
                 return
@@ -404,9 +414,11 @@ class ZenControl:
             await self._first_connected.wait()
         except asyncio.CancelledError:
             raise
+        delay = self.event_keepalive_interval
+        starting: set[str] = set()
         while not self._stopping:
             try:
-                await asyncio.sleep(self.event_keepalive_interval)
+                await asyncio.sleep(delay)
             except asyncio.CancelledError:
                 raise
             if self._stopping or not self.is_event_monitoring_active():
@@ -424,6 +436,17 @@ class ZenControl:
                         ctrl.name,
                         err,
                     )
+            # A controller still booting is re-checked eagerly (exponential
+            # backoff from the minimum when it first starts, holding at the
+            # interval) so events are re-asserted soon after startup completes.
+            previously_starting = starting
+            starting = {ctrl.name for ctrl in self.controllers} & self._controllers_starting
+            if not starting:
+                delay = self.event_keepalive_interval
+            elif starting - previously_starting:
+                delay = min(self.event_startup_poll_min_delay, self.event_keepalive_interval)
+            else:
+                delay = min(delay * 2, self.event_keepalive_interval)
 
     async def _on_controller_event(self, ctrl: ZenController, ev: ZenDecodedEvent) -> None:
         await self._dispatcher.handle(ctrl, ev)
@@ -571,8 +594,10 @@ class ZenControl:
         sequence can take several minutes after a reboot.
         """
         if not self.is_event_monitoring_active():
+            self._controllers_starting.discard(ctrl.name)
             return False
         if self._wiring is not None and self._wiring.get(ctrl) is None:
+            self._controllers_starting.discard(ctrl.name)
             # Binding was dropped (e.g. MAC promotion conflict) - do not keep
             # confirming emit into a route that no longer exists.
             self.logger.debug(
@@ -582,6 +607,10 @@ class ZenControl:
             return False
 
         ready = await self.commands.query_controller_startup_complete(ctrl)
+        if ready is False:
+            self._controllers_starting.add(ctrl.name)
+        else:
+            self._controllers_starting.discard(ctrl.name)
         if ready is None:
             self.logger.debug(
                 "No response from %s during event keepalive ping",
@@ -764,15 +793,9 @@ class ZenControl:
                     instances.extend(await self.commands.query_instances_by_address(address=address))
                 self._ecd_instances_by_controller[ctrl.name] = instances
             for instance in instances:
-                match instance.type:
-                    case ZenInstanceType.PUSH_BUTTON:
-                        entities.add(await self.ctx.create_button(instance))
-                    case ZenInstanceType.OCCUPANCY_SENSOR:
-                        entities.add(await self.ctx.create_motion_sensor(instance))
-                    case ZenInstanceType.ABSOLUTE_INPUT:
-                        entities.add(await self.ctx.create_absolute_input(instance))
-                    case _:
-                        continue
+                factory = _INSTANCE_FACTORIES.get(instance.type)
+                if factory is not None:
+                    entities.add(await getattr(self.ctx, factory)(instance))
         return entities
 
     async def get_buttons(self, ctrl: ZenController | None = None) -> set[ZenButton]:
@@ -220,7 +220,7 @@ class ZenEventWiring:
             try:
                 await self.on_resync()
             except Exception as err:
-                self.logger.error(f"on_resync error: {err}", exc_info=True)
+                self.logger.error("on_resync error: %s", err, exc_info=True)
 
     async def _configure_event_delivery(self, ctrl: ZenController, lease: Lease, mode: ZenEventMode) -> None:
         if mode.transport is Transport.UNICAST:
@@ -61,16 +61,16 @@ class ZenDatagramProtocol(asyncio.DatagramProtocol):
         try:
             self.response_handler(data, addr)
         except Exception as exc:
-            self.logger.error(f"Response handler failed: {exc}", exc_info=exc)
+            self.logger.error("Response handler failed: %s", exc, exc_info=exc)
         
     def error_received(self, exc: Exception) -> None:
-        self.logger.warning(f"Request protocol error: {exc}")
+        self.logger.warning("Request protocol error: %s", exc)
         if self.on_transport_lost:
             self.on_transport_lost(exc)
         
     def connection_lost(self, exc: Exception | None) -> None:
         if exc:
-            self.logger.warning(f"Request connection lost: {exc}")
+            self.logger.warning("Request connection lost: %s", exc)
         else:
             self.logger.info("Request connection closed")
         if self.on_transport_lost:
@@ -123,7 +123,7 @@ class ZenClient:
         )
         self._transport = transport
         self._protocol = protocol
-        self.logger.info(f"Connected to Zen server at {server[0]}:{server[1]}")
+        self.logger.info("Connected to Zen server at %s:%s", server[0], server[1])
         return self
 
     def _mark_disconnected(self, exc: Exception | None = None) -> None:
@@ -188,7 +188,7 @@ class ZenClient:
                     req.timestamp = time.time()
                     self._transport.sendto(wire)
                 except Exception as e:
-                    self.logger.debug(f"Send failed (attempt {i + 1}): {e}")
+                    self.logger.debug("Send failed (attempt %d): %s", i + 1, e)
                 # asyncio.wait does not cancel fut on timeout (unlike wait_for)
                 done, _ = await asyncio.wait({fut}, timeout=timeout)
                 if done:
@@ -237,22 +237,25 @@ class ZenClient:
 
     def _maybe_print_traffic(self, response: ZenResponse) -> None:
         req = response.request
-        if not self.print_traffic:
+        # Skip the hex formatting entirely when INFO would be dropped anyway.
+        if not self.print_traffic or not self.logger.isEnabledFor(logging.INFO):
             return
         elif req is None or not req.raw_sent or not response.raw_rcvd:
             return
         elif response.response_type is ZenResponseType.TIMEOUT:
             wait_time_ms = (time.time() - req.timestamp) * 1000 if req else 0.0
             self.logger.info(
-                f"REQUEST: [{' '.join(f'0x{b:02X}' for b in req.raw_sent)}]  "
-                f"RESPONSE TIMEOUT after {wait_time_ms:.0f}ms"
+                "REQUEST: [%s]  RESPONSE TIMEOUT after %.0fms",
+                " ".join(f"0x{b:02X}" for b in req.raw_sent),
+                wait_time_ms,
             )
         else:
             rtt_ms = (response.timestamp - req.timestamp) * 1000
             self.logger.info(
-                f"REQUEST: [{' '.join(f'0x{b:02X}' for b in req.raw_sent)}]  "
-                f"RESPONSE: [{' '.join(f'0x{b:02X}' for b in response.raw_rcvd)}]  "
-                f"RTT: {rtt_ms:.0f}ms",
+                "REQUEST: [%s]  RESPONSE: [%s]  RTT: %.0fms",
+                " ".join(f"0x{b:02X}" for b in req.raw_sent),
+                " ".join(f"0x{b:02X}" for b in response.raw_rcvd),
+                rtt_ms,
             )
 
     def _receive_response(self, datagram: bytes, addr: tuple[str, int]) -> None:
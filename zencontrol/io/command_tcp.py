@@ -173,7 +173,7 @@ class ZenTcpClient:
                     self._writer.write(wire)
                     await self._writer.drain()
                 except Exception as e:
-                    self.logger.debug(f"Send failed (attempt {i + 1}): {e}")
+                    self.logger.debug("Send failed (attempt %d): %s", i + 1, e)
                     self._mark_disconnected(e)
                     return ZenResponse(ZenResponseType.TIMEOUT, request=req)
                 # asyncio.wait does not cancel fut on timeout (unlike wait_for)
@@ -224,22 +224,25 @@ class ZenTcpClient:
 
     def _maybe_print_traffic(self, response: ZenResponse) -> None:
         req = response.request
-        if not self.print_traffic:
+        # Skip the hex formatting entirely when INFO would be dropped anyway.
+        if not self.print_traffic or not self.logger.isEnabledFor(logging.INFO):
             return
         elif req is None or not req.raw_sent or not response.raw_rcvd:
             return
         elif response.response_type is ZenResponseType.TIMEOUT:
             wait_time_ms = (time.time() - req.timestamp) * 1000 if req else 0.0
             self.logger.info(
-                f"REQUEST: [{' '.join(f'0x{b:02X}' for b in req.raw_sent)}]  "
-                f"RESPONSE TIMEOUT after {wait_time_ms:.0f}ms"
+                "REQUEST: [%s]  RESPONSE TIMEOUT after %.0fms",
+                " ".join(f"0x{b:02X}" for b in req.raw_sent),
+                wait_time_ms,
             )
         else:
             rtt_ms = (response.timestamp - req.timestamp) * 1000
             self.logger.info(
-                f"REQUEST: [{' '.join(f'0x{b:02X}' for b in req.raw_sent)}]  "
-                f"RESPONSE: [{' '.join(f'0x{b:02X}' for b in response.raw_rcvd)}]  "
-                f"RTT: {rtt_ms:.0f}ms",
+                "REQUEST: [%s]  RESPONSE: [%s]  RTT: %.0fms",
+                " ".join(f"0x{b:02X}" for b in req.raw_sent),
+                " ".join(f"0x{b:02X}" for b in response.raw_rcvd),
+                rtt_ms,
             )
 
     def _receive_response(self, datagram: bytes, addr: tuple[str, int]) -> None:
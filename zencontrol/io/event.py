@@ -71,26 +71,19 @@ def parse_frame(data: bytes, addr: tuple[str, int]) -> ZenEvent | None:
     Pure: no logging, no socket state. Used by the endpoint on receive and by
     tests / offline tools that need framing without a live socket.
     """
-    if len(data) < _MIN_FRAME_LEN or data[0:2] != _MAGIC:
+    if len(data) < _MIN_FRAME_LEN or not data.startswith(_MAGIC):
         return None
-
-    mac = data[2:8]
-    target = int.from_bytes(data[8:10], byteorder="big")
-    code = data[10]
-    payload_len = data[11]
-    payload = data[12:-1]
-    received_checksum = data[-1]
-
-    if received_checksum != _checksum(data[:-1]):
+    # Length and checksum come straight off the datagram; slice only valid frames.
+    if len(data) != data[11] + _MIN_FRAME_LEN:
         return None
-    if len(payload) != payload_len:
+    if data[-1] != _checksum(data[:-1]):
         return None
 
     return ZenEvent(
-        mac=mac,
-        target=target,
-        code=code,
-        payload=bytes(payload),
+        mac=bytes(data[2:8]),
+        target=(data[8] << 8) | data[9],
+        code=data[10],
+        payload=bytes(data[12:-1]),
         host=addr[0],
         received_at=time.time(),
     )
@@ -116,16 +109,18 @@ def accept_datagram(
     log = logger or logging.getLogger(__name__)
     event = parse_frame(data, addr)
     if event is None:
-        log.debug(
-            "Invalid event packet from %s: %s",
-            addr,
-            ", ".join(f"0x{b:02x}" for b in data),
-        )
+        # Hex dump is only built when someone is listening at DEBUG.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Invalid event packet from %s: %s",
+                addr,
+                ", ".join(f"0x{b:02x}" for b in data),
+            )
         return False
     try:
         sink(event)
     except Exception as exc:
-        log.error(f"Event sink failed: {exc}", exc_info=exc)
+        log.error("Event sink failed: %s", exc, exc_info=exc)
         return False
     return True
 
@@ -147,11 +142,11 @@ class ZenEventProtocol(asyncio.DatagramProtocol):
         accept_datagram(data, addr, self.sink, self.logger)
 
     def error_received(self, exc: Exception) -> None:
-        self.logger.warning(f"Event protocol error: {exc}")
+        self.logger.warning("Event protocol error: %s", exc)
 
     def connection_lost(self, exc: Exception | None) -> None:
         if exc:
-            self.logger.warning(f"Event connection lost: {exc}")
+            self.logger.warning("Event connection lost: %s", exc)
         else:
             self.logger.info("Event connection closed")
 
@@ -239,7 +234,7 @@ class ZenEndpoint:
             if sock:
                 sock.setsockopt(socket.IPPROTO_IP, socket.IP_DROP_MEMBERSHIP, self._mreq)
         except OSError as err:
-            self.logger.debug(f"Error dropping multicast membership: {err}")
+            self.logger.debug("Error dropping multicast membership: %s", err)
 
     def _create_multicast_socket(self) -> socket.socket:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
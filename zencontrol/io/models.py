@@ -38,8 +38,8 @@ class ZenRequest:
         # Validate request type
         match self.request_type:
             case ZenRequestType.BASIC:
-                # Pad data to 4 bytes if it's less than 4 bytes
-                self.data = self.data + bytes([0x00] * (4 - n)) if n < 4 else self.data
+                # Pad data to 4 bytes if it's less than 4 bytes (ljust is a no-op at 4)
+                self.data = self.data.ljust(4, b"\x00")
                 if len(self.data) != 4:
                     raise ValueError("ZenRequest.data must be exactly 4 bytes when request type is BASIC")
             case ZenRequestType.DALI_COLOUR:
@@ -166,13 +166,13 @@ class ZenTestClient:
     def _ecd_address(self, ctrl: ZenController, target: int) -> ZenAddress | None:
         address = ecd_address_from_target(ctrl, target)
         if address is None:
-            self.commands.logger.error(f"Invalid ECD event target: {target}")
+            self.commands.logger.error("Invalid ECD event target: %s", target)
         return address
 
     def _ecg_or_group(self, ctrl: ZenController, target: int) -> ZenAddress | None:
         address = ecg_or_group_address_from_target(ctrl, target)
         if address is None:
-            self.commands.logger.error(f"Invalid gear/group event target: {target}")
+            self.commands.logger.error("Invalid gear/group event target: %s", target)
         return address
 
     async def _call(self, callback: LegacyCallback | None, **kwargs: Any) -> None:
@@ -181,7 +181,7 @@ class ZenTestClient:
         try:
             await callback(**kwargs)
         except Exception as err:
-            self.commands.logger.error(f"Event callback error: {err}", exc_info=err)
+            self.commands.logger.error("Event callback error: %s", err, exc_info=err)
 
     async def _on_controller_event(self, ctrl: ZenController, ev: ZenDecodedEvent) -> None:
         match ev:
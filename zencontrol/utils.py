@@ -3,18 +3,21 @@ Utility functions for the ZenControl library
 """
 
 import asyncio
-import ipaddress
 import signal
 import socket
 from typing import Any
 
 
 def is_ipv4_address(host: str) -> bool:
-    """True when host is already a dotted-quad IPv4 literal (no DNS)."""
+    """True when host is already a dotted-quad IPv4 literal (no DNS).
+
+    inet_pton is the C parser and, like ipaddress, rejects short forms and
+    leading zeros that inet_aton would accept.
+    """
     try:
-        ipaddress.IPv4Address(host)
+        socket.inet_pton(socket.AF_INET, host)
         return True
-    except ValueError:
+    except (OSError, ValueError):
         return False
 
 